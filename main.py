@@ -6,17 +6,236 @@ Built using Google ADK (Agent Development Kit)
 This module implements the main entry point for the AI recruitment agent.
 """
 
+import asyncio
+import contextlib
+import functools
+import heapq
+from collections import OrderedDict, defaultdict, deque
 import logging
-from typing import Dict, Any, Optional
+import operator
+import re
+import sys
+import threading
+import time
+from typing import Dict, Any, MutableMapping, Optional
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime
 
+try:
+    import orjson  # optional: C serializer for the CLI output
+except ImportError:
+    orjson = None
+
 # Simulating ADK imports (would be: from google.adk import Agent, Tool, etc.)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Skill vocabulary shared by the resume parser and job requirement extractor
+KEYWORDS = tuple(map(sys.intern, ("Python", "Java", "Machine Learning", "Data Analysis", "Cloud", "SQL", "API", "Docker")))
+
+# One canonical string object per vocabulary skill, keyed case-insensitively.
+# Fixed at import: skills outside the vocabulary never grow these tables.
+_SKILL_INTERN: dict[str, str] = {k.casefold(): k for k in KEYWORDS}
+
+# Bit position per vocabulary skill: vocabulary skill sets are encoded as int bitmasks
+_SKILL_BIT: dict[str, int] = {k: 1 << i for i, k in enumerate(KEYWORDS)}
+
+def _intern(skill: str) -> str:
+    """Return the canonical shared string for a vocabulary skill, else the interned name."""
+    return _SKILL_INTERN.get(skill.casefold()) or sys.intern(skill)
+
+def _skills_mask(skills) -> int:
+    """Encode the vocabulary skills among skills as a bitmask; other names are ignored."""
+    mask = 0
+    for skill in skills:
+        mask |= _SKILL_BIT.get(_intern(skill), 0)
+    return mask
+
+def _encode_skills(skills) -> tuple[int, frozenset[str]]:
+    """Split skills into a vocabulary bitmask and a casefolded set of out-of-vocabulary names."""
+    mask = _skills_mask(skills)
+    extra = frozenset(skill.casefold() for skill in skills if _intern(skill) not in _SKILL_BIT)
+    return mask, extra
+
+def _mask_skills(mask: int) -> list[str]:
+    """Decode a skill bitmask back to names, in vocabulary order."""
+    names = []
+    while mask:
+        low = mask & -mask
+        names.append(KEYWORDS[low.bit_length() - 1])
+        mask ^= low
+    return names
+
+def _build_keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern:
+    """
+    Compile the vocabulary into a single alternation scanned once per text.
+    
+    Keywords match as plain substrings, as the per-keyword ``in`` checks did:
+    "APIs", "MySQL" and "Dockerized" count, and so does "Java" in "JavaScript".
+    The alternation sits in a lookahead, so every start position is tried and
+    keywords that overlap one another (e.g. "java" and "api" in "javapi") are
+    all reported. Where several share a start position the longest wins.
+    Matching is case-sensitive against lowercased keywords; callers pass
+    text lowercased once (and cached) rather than paying IGNORECASE per scan.
+    """
+    lowered = sorted((k.lower() for k in keywords), key=len, reverse=True)
+    return re.compile(r"(?=(" + "|".join(map(re.escape, lowered)) + r"))")
+
+_KW_RE = _build_keyword_pattern(KEYWORDS)
+_KW_CANON = {k.lower(): k for k in KEYWORDS}
+
+def _match_keywords(text_lc: str) -> list[str]:
+    """Return vocabulary keywords found in already-lowercased text, in vocabulary order."""
+    found = set()
+    for match in _KW_RE.finditer(text_lc):
+        found.add(_KW_CANON[match.group(1)])
+        if len(found) == len(KEYWORDS):
+            break  # whole vocabulary seen; skip the rest of the text
+    return [k for k in KEYWORDS if k in found]
+
+@functools.lru_cache(maxsize=128)
+def _job_requirements(job_description: str) -> tuple[str, ...]:
+    """Lowercase and scan a job description once; repeated screenings hit the cache."""
+    return tuple(_match_keywords(job_description.lower()))
+
+_NUM = r"(\d+(?:\.\d+)?)"
+_YEARS = r"\s*(?:years?|yrs?)\b"
+_YEARS_RE = re.compile(
+    r"(?:at\s+least|minimum(?:\s+of)?)\s+" + _NUM + r"\s*\+?" + _YEARS  # "at least 3 years"
+    + r"|" + _NUM + r"\s*(?:-|–|to)\s*\d+(?:\.\d+)?" + _YEARS           # "3-5 years" -> 3
+    + r"|" + _NUM + r"\s*\+" + _YEARS                                   # "3+ years"
+)
+
+@functools.lru_cache(maxsize=128)
+def _min_required_years(job_description: str) -> float:
+    """
+    Smallest experience requirement stated in a job description (0 if none).
+    
+    Only unambiguous requirement phrases count: "N+ years", "at least N years",
+    "minimum (of) N years", and ranges "N-M years" / "N to M years", which use the
+    lower bound N. A bare "N years" is ignored because it may describe something
+    else ("founded 20 years ago"), so such text never raises the bar.
+    """
+    years = [float(next(g for g in groups if g)) for groups in _YEARS_RE.findall(job_description.lower())]
+    return min(years, default=0.0)
+
+def _recommendation(match_score: float) -> str:
+    """Map a screening match score to the screening verdict."""
+    return "PASS" if match_score >= 70 else "REVIEW" if match_score >= 50 else "REJECT"
+
+def _ts() -> int:
+    """Wall-clock timestamp in nanoseconds; formatted only at serialization time."""
+    return time.time_ns()
+
+def _render_timestamps(obj: Any) -> Any:
+    """
+    Replace the agent's own ``ts_ns`` stamps with ISO-8601 ``timestamp`` strings.
+    
+    Only stage result dataclasses and workflow result dicts are rewritten; plain
+    dicts and lists are walked to reach them. Values held inside results (job data,
+    questions) are passed through untouched, so user data keyed ``ts_ns`` keeps it.
+    """
+    if isinstance(obj, (ScreeningResult, MatchingResult, InterviewResult)):
+        rendered = {f.name: getattr(obj, f.name) for f in fields(obj)}
+        rendered["timestamp"] = _format_ts(rendered.pop("ts_ns"))
+        return rendered
+    if isinstance(obj, _WorkflowResult):
+        return {
+            ("timestamp" if key == "ts_ns" else key):
+                (_format_ts(value) if key == "ts_ns" else _render_timestamps(value))
+            for key, value in obj.items()
+        }
+    if isinstance(obj, dict):
+        return {key: _render_timestamps(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_render_timestamps(item) for item in obj]
+    return obj
+
+def _format_ts(ts_ns: int) -> str:
+    """Format a nanosecond timestamp as local-time ISO-8601."""
+    seconds, nanos = divmod(ts_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
+class TimestampEncoder(json.JSONEncoder):
+    """JSON encoder that renders agent ``ts_ns`` stamps as ISO-8601 ``timestamp`` strings."""
+    
+    def iterencode(self, o, _one_shot=False):
+        return super().iterencode(_render_timestamps(o), _one_shot)
+    
+    def default(self, o):
+        # Dataclasses nested inside results (e.g. JobMatch) are emitted field by field
+        if is_dataclass(o) and not isinstance(o, type):
+            return {f.name: getattr(o, f.name) for f in fields(o)}
+        return super().default(o)
+
+def to_json(obj: Any) -> bytes:
+    """
+    Serialize agent results as indented UTF-8 JSON bytes, using orjson when installed.
+    
+    Only the agent's result containers are rewritten for timestamps; nested values
+    (including dataclasses such as JobMatch) go straight to the encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(_render_timestamps(obj), option=orjson.OPT_INDENT_2)
+    # ensure_ascii=False so both paths emit the same raw UTF-8
+    return json.dumps(obj, indent=2, ensure_ascii=False, cls=TimestampEncoder).encode()
+
+@functools.lru_cache(maxsize=None)
+def _skill_points(req_count: int) -> tuple[float, ...]:
+    """Skill component of the fit score for 0..req_count matched skills (shared per count)."""
+    return tuple((matched / max(1, req_count)) * 60 for matched in range(req_count + 1))
+
+# Column-encoded job database: (skill masks, out-of-vocabulary skill sets, skill-point tables, years required)
+_JobTable = tuple[list[int], list[frozenset[str]], list[tuple[float, ...]], list[float]]
+
+def _encode_jobs(job_database: list[Dict]) -> _JobTable:
+    """Encode a job list column-wise: required skill masks and extras, skill-point tables, years required."""
+    encoded = [_encode_skills(job.get("required_skills", ())) for job in job_database]
+    req_masks = [mask for mask, _ in encoded]
+    req_extras = [extra for _, extra in encoded]
+    skill_points = [_skill_points(mask.bit_count() + len(extra)) for mask, extra in encoded]
+    years_req = [max(1, job.get("years_experience_required", 1)) for job in job_database]
+    return req_masks, req_extras, skill_points, years_req
+
+def _jobs_fingerprint(job_database: list[Dict]) -> tuple:
+    """Cheap content key over the fields _encode_jobs reads; changes whenever the encoding would."""
+    return tuple(
+        (job.get("id"), tuple(job.get("required_skills", ())), job.get("years_experience_required", 1))
+        for job in job_database
+    )
+
+# Encoded job databases kept per agent (e.g. one per job board)
+_JOB_TABLE_CACHE_SIZE = 8
+
+def _score_jobs(skills_mask: int, skills_extra: frozenset[str], experience_years: float,
+                req_masks: list[int], req_extras: list[frozenset[str]],
+                skill_points: list[tuple[float, ...]], years_req: list[float]) -> list[float]:
+    """Weighted fit score (60% skills, 40% experience) of one candidate against every encoded job."""
+    # The skill term takes only req_count + 1 distinct values, so it is a table lookup.
+    # Out-of-vocabulary skills are rare, so their set intersection is skipped when empty.
+    return [
+        points[(skills_mask & req_mask).bit_count() + (len(skills_extra & req_extra) if req_extra else 0)]
+        + min(1.0, experience_years / years) * 40
+        for req_mask, req_extra, points, years
+        in zip(req_masks, req_extras, skill_points, years_req, strict=True)
+    ]
+
+@dataclass(frozen=True, slots=True)
+class Question:
+    """A single interview question; immutable so instances can be shared across results."""
+    id: int
+    category: str
+    question: str
+
+# Interview questions that never change between candidates, shared across results
+_STATIC_QUESTIONS = (
+    Question(id=2, category="Technical", question="Walk us through a challenging project you've worked on."),
+    Question(id=3, category="Behavioral", question="How do you handle conflicts in a team environment?"),
+    Question(id=4, category="Behavioral", question="Tell us about a time you failed and what you learned.")
+)
+
 @dataclass
 class CandidateProfile:
     """Represents a candidate profile."""
@@ -25,110 +244,241 @@ class CandidateProfile:
     resume_text: str
     skills: list[str]
     experience_years: float
+    skills_mask: int = field(init=False, repr=False)
+    skills_extra: frozenset[str] = field(init=False, repr=False)
+    resume_text_lc: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Share canonical skill strings and encode them once; job matching ANDs against this per job
+        self.skills = [_intern(skill) for skill in self.skills]
+        self.skills_mask, self.skills_extra = _encode_skills(self.skills)
+        # Lowercase the resume once for every later keyword scan
+        self.resume_text_lc = self.resume_text.lower()
     
+    @classmethod
+    def from_dict(cls, candidate_data: Dict[str, Any]) -> "CandidateProfile":
+        """Build a profile from workflow candidate data."""
+        return cls(
+            name=candidate_data["name"],
+            email=candidate_data["email"],
+            resume_text=candidate_data["resume"],
+            skills=candidate_data.get("skills", []),
+            experience_years=candidate_data.get("experience_years", 0)
+        )
+
+class _WorkflowResult(dict):
+    """Workflow-level result dict built by the agent; marks its ts_ns for rendering."""
+
+@dataclass(slots=True)
+class ScreeningResult:
+    """Output of the screening agent."""
+    match_score: float
+    resume_skills: list[str]
+    required_skills: list[str]
+    recommendation: str
+    ts_ns: int = field(default_factory=_ts)
+
+@dataclass(slots=True)
+class JobMatch:
+    """A single job suggested by the matching agent."""
+    job_id: str
+    title: str
+    company: str
+    match_score: float
+    key_matches: list[str]
+
+@dataclass(slots=True)
+class MatchingResult:
+    """Output of the matching agent."""
+    candidate_id: str
+    total_matches_found: int
+    top_matches: list[JobMatch]
+    ts_ns: int = field(default_factory=_ts)
+
+@dataclass(slots=True)
+class InterviewResult:
+    """Output of the interview agent."""
+    role: str
+    total_questions: int
+    questions: tuple[Question, ...]
+    difficulty_level: str
+    ts_ns: int = field(default_factory=_ts)
+    
+class SemanticSkillExtractor:
+    """
+    Embedding-based skill extractor that scores a whole batch of resumes in one forward pass.
+    
+    Needs the optional sentence-transformers package (imported on construction) and uses
+    CUDA with fp16 autocast when available. Pass an instance to full_workflow_batch to
+    replace keyword matching on resumes.
+    """
+    
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", skills: tuple[str, ...] = KEYWORDS,
+                 threshold: float = 0.35, device: Optional[str] = None, batch_size: int = 256):
+        """
+        Load the encoder and embed the skill vocabulary once.
+        
+        Args:
+            model_name: sentence-transformers model to load
+            skills: Skill vocabulary to detect
+            threshold: Minimum cosine similarity for a skill to count as present
+            device: Torch device; defaults to "cuda" when available
+            batch_size: Texts per forward pass
+        """
+        try:
+            import torch
+            from sentence_transformers import SentenceTransformer
+        except ImportError as exc:
+            raise ImportError("SemanticSkillExtractor requires the sentence-transformers package") from exc
+        
+        self._torch = torch
+        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self.model = SentenceTransformer(model_name, device=self.device)
+        self.skills = [_intern(skill) for skill in skills]
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self._skill_emb = self._embed(self.skills)
+    
+    def _embed(self, texts: list[str]):
+        """Encode texts to unit-norm embeddings, in fp16 on GPU."""
+        torch = self._torch
+        autocast = (torch.autocast(device_type="cuda", dtype=torch.float16)
+                    if self.device.startswith("cuda") else contextlib.nullcontext())
+        with torch.inference_mode(), autocast:
+            return self.model.encode(texts, batch_size=self.batch_size, convert_to_tensor=True,
+                                     normalize_embeddings=True)
+    
+    def _similarities(self, texts: list[str]) -> list[list[float]]:
+        """Cosine similarity of every text to every skill, one row per text."""
+        # Embeddings are normalized, so the matmul gives cosine similarities
+        return (self._embed(texts) @ self._skill_emb.T).cpu().tolist()
+    
+    def extract_batch(self, texts: list[str]) -> list[list[str]]:
+        """Return the detected skill names per text, in the extractor's skill order."""
+        if not texts:
+            return []
+        return [
+            [skill for skill, similarity in zip(self.skills, row, strict=True) if similarity > self.threshold]
+            for row in self._similarities(texts)
+        ]
+
 class RecruitmentAgent:
     """Multi-agent orchestrator for recruitment workflows."""
     
-    def __init__(self, api_key: str = None, model: str = "gemini-2.0-flash"):
+    def __init__(self, api_key: str = None, model: str = "gemini-2.0-flash",
+                 memory_size: int = 256, backing_store: Optional[MutableMapping] = None):
         """
         Initialize the recruitment agent.
         
         Args:
             api_key: Gemini API key
             model: LLM model to use
+            memory_size: Number of recent results kept in memory per session key
+            backing_store: Optional durable mapping (e.g. a shelve) mirroring the latest result per key
         """
         self.api_key = api_key
         self.model = model
-        self.session_state = {}
-        logger.info(f"Initialized RecruitmentAgent with model: {model}")
+        self.session_state = defaultdict(lambda: deque(maxlen=memory_size))
+        self.backing_store = backing_store
+        self._memory_lock = threading.Lock()  # async workflows save from to_thread workers
+        self._pinned_jobs = (None, None)  # (job list, encoded table) installed by set_job_database
+        self._job_tables = OrderedDict()  # content fingerprint -> encoded table, LRU order
+        self._job_tables_lock = threading.Lock()
+        logger.info("Initialized RecruitmentAgent with model: %s", model)
     
-    def screen_candidate(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+    def screen_candidate(self, resume_text: str, job_description: str,
+                         resume_text_lc: Optional[str] = None) -> ScreeningResult:
         """
         Screen a candidate against a job description.
         
         This demonstrates the SCREENING AGENT (Feature: Multi-agent system).
+        Pass resume_text_lc (e.g. CandidateProfile.resume_text_lc) to skip re-lowercasing.
         """
-        logger.info(f"Screening candidate resume against job")
+        logger.info("Screening candidate resume against job")
         
         # Extract key skills from resume
-        resume_skills = self._extract_skills(resume_text)
+        resume_skills = self._extract_skills(resume_text, resume_text_lc)
         
         # Extract required skills from job description
         job_skills = self._extract_job_requirements(job_description)
         
         # Calculate match score
-        match_score = self._calculate_match_score(resume_skills, job_skills)
-        
-        screening_result = {
-            "match_score": match_score,
-            "resume_skills": resume_skills,
-            "required_skills": job_skills,
-            "recommendation": "PASS" if match_score >= 70 else "REVIEW" if match_score >= 50 else "REJECT",
-            "timestamp": datetime.now().isoformat()
-        }
+        match_score = self._calculate_match_score(_skills_mask(resume_skills), _skills_mask(job_skills))
+        
+        screening_result = ScreeningResult(
+            match_score=match_score,
+            resume_skills=resume_skills,
+            required_skills=job_skills,
+            recommendation=_recommendation(match_score)
+        )
         
         # Store in session memory (Feature: Sessions & Memory)
         self._save_to_memory("screening_result", screening_result)
         
         return screening_result
     
-    def match_jobs(self, candidate: CandidateProfile, job_database: list[Dict]) -> Dict[str, Any]:
+    def match_jobs(self, candidate: CandidateProfile, job_database: list[Dict]) -> MatchingResult:
         """
         Match candidate to suitable jobs.
         
         This demonstrates the MATCHING AGENT (Feature: Sequential agents).
         """
-        logger.info(f"Matching jobs for candidate: {candidate.name}")
+        return self._match_encoded(candidate, job_database, self._job_table_for(job_database))
+    
+    def _match_encoded(self, candidate: CandidateProfile, job_database: list[Dict],
+                       table: _JobTable) -> MatchingResult:
+        """Match candidate against job_database using its already-encoded table."""
+        logger.info("Matching jobs for candidate: %s", candidate.name)
+        
+        # Score every job in one pass over the column-encoded database
+        req_masks, req_extras, skill_points, years_req = table
+        scores = _score_jobs(candidate.skills_mask, candidate.skills_extra, candidate.experience_years,
+                             req_masks, req_extras, skill_points, years_req)
         
         matches = []
-        for job in job_database:
-            score = self._calculate_job_fit(candidate, job)
+        for job, req_mask, req_extra, score in zip(job_database, req_masks, req_extras, scores, strict=True):
             if score > 50:
-                matches.append({
-                    "job_id": job["id"],
-                    "title": job["title"],
-                    "company": job["company"],
-                    "match_score": score,
-                    "key_matches": self._find_skill_matches(candidate.skills, job["required_skills"])
-                })
-        
-        # Sort by match score
-        matches.sort(key=lambda x: x["match_score"], reverse=True)
-        top_matches = matches[:3]  # Return top 3
-        
-        matching_result = {
-            "candidate_id": candidate.name,
-            "total_matches_found": len(matches),
-            "top_matches": top_matches,
-            "timestamp": datetime.now().isoformat()
-        }
+                matches.append(JobMatch(
+                    job_id=job["id"],
+                    title=job["title"],
+                    company=job["company"],
+                    match_score=score,
+                    key_matches=self._find_skill_matches(candidate, job, req_mask, req_extra)
+                ))
+        
+        # Select top 3 by match score without sorting the full list
+        top_matches = heapq.nlargest(3, matches, key=operator.attrgetter("match_score"))
+        
+        matching_result = MatchingResult(
+            candidate_id=candidate.name,
+            total_matches_found=len(matches),
+            top_matches=top_matches
+        )
         
         self._save_to_memory("matching_result", matching_result)
         return matching_result
     
-    def generate_interview(self, role_title: str, candidate_skills: list[str]) -> Dict[str, Any]:
+    def generate_interview(self, role_title: str, candidate_skills: list[str]) -> InterviewResult:
         """
         Generate interview questions for a specific role.
         
         This demonstrates the INTERVIEW AGENT (Feature: Tools integration).
         """
-        logger.info(f"Generating interview questions for role: {role_title}")
-        
-        questions = [
-            {"id": 1, "category": "Technical", "question": f"Describe your experience with {candidate_skills[0] if candidate_skills else 'software development'}?"},
-            {"id": 2, "category": "Technical", "question": "Walk us through a challenging project you've worked on."},
-            {"id": 3, "category": "Behavioral", "question": "How do you handle conflicts in a team environment?"},
-            {"id": 4, "category": "Behavioral", "question": "Tell us about a time you failed and what you learned."},
-            {"id": 5, "category": "Role-Specific", "question": f"Why are you interested in this {role_title} position?"}
-        ]
+        logger.info("Generating interview questions for role: %s", role_title)
         
-        interview_result = {
-            "role": role_title,
-            "total_questions": len(questions),
-            "questions": questions,
-            "difficulty_level": "MEDIUM",
-            "timestamp": datetime.now().isoformat()
-        }
+        # Only the skill- and role-specific questions are built per call
+        questions = (
+            Question(id=1, category="Technical", question=f"Describe your experience with {candidate_skills[0] if candidate_skills else 'software development'}?"),
+            *_STATIC_QUESTIONS,
+            Question(id=5, category="Role-Specific", question=f"Why are you interested in this {role_title} position?")
+        )
+        
+        interview_result = InterviewResult(
+            role=role_title,
+            total_questions=len(questions),
+            questions=questions,
+            difficulty_level="MEDIUM"
+        )
         
         self._save_to_memory("interview_questions", interview_result)
         return interview_result
@@ -139,89 +489,240 @@ class RecruitmentAgent:
         
         Demonstrates: Sequential agents, Memory management, Observability.
         """
-        logger.info(f"Starting full workflow for: {candidate_data['name']}")
+        logger.info("Starting full workflow for: %s", candidate_data["name"])
+        
+        # Step 0: Cheap structured-field check before any text processing
+        rejection = self._pre_screen(candidate_data, job_description)
+        if rejection is not None:
+            return rejection
+        
+        candidate = CandidateProfile.from_dict(candidate_data)
         
         # Step 1: Screen candidate
-        screening = self.screen_candidate(candidate_data["resume"], job_description)
+        screening = self.screen_candidate(candidate.resume_text, job_description, candidate.resume_text_lc)
         
-        if screening["recommendation"] == "REJECT":
-            logger.warning(f"Candidate {candidate_data['name']} rejected in screening")
+        if screening.recommendation == "REJECT":
+            logger.warning("Candidate %s rejected in screening", candidate_data["name"])
             return {"status": "REJECTED", "stage": "screening", "result": screening}
         
-        # Step 2: Match jobs (Parallel: could run simultaneously in production)
-        candidate = CandidateProfile(
-            name=candidate_data["name"],
-            email=candidate_data["email"],
-            resume_text=candidate_data["resume"],
-            skills=candidate_data.get("skills", []),
-            experience_years=candidate_data.get("experience_years", 0)
-        )
-        matching = self.match_jobs(candidate, jobs_db)
+        # Steps 2-3: Match jobs and generate interview
+        return self._finish_workflow(candidate, screening, jobs_db)
+    
+    def full_workflow_batch(self, candidates: list[Dict[str, Any]], job_description: str,
+                            jobs_db: list[Dict],
+                            skill_extractor: Optional[SemanticSkillExtractor] = None) -> list[Dict[str, Any]]:
+        """
+        Execute the complete workflow for many candidates against one job description.
+        
+        The job description is parsed and jobs_db encoded once for the whole batch,
+        and every passing candidate is matched against that same encoded table.
+        Resumes are still scanned one candidate at a time. Each entry matches
+        what full_workflow would return for that candidate.
         
-        # Step 3: Generate interview
-        if matching["top_matches"]:
-            best_match = matching["top_matches"][0]
-            interview = self.generate_interview(best_match["title"], candidate.skills)
+        Pass a SemanticSkillExtractor to detect resume skills by embedding similarity,
+        batched in one encoder pass, instead of keyword matching.
+        """
+        logger.info("Starting batch workflow for %d candidates", len(candidates))
+        
+        # Shared work: requirement mask and encoded job table
+        job_skills = self._extract_job_requirements(job_description)
+        job_mask = _skills_mask(job_skills)
+        job_table = self._job_table_for(jobs_db)
+        
+        # Step 0: pre-screen everyone on structured fields
+        results: list[Optional[Dict[str, Any]]] = [None] * len(candidates)
+        pending = []
+        for i, candidate_data in enumerate(candidates):
+            rejection = self._pre_screen(candidate_data, job_description)
+            if rejection is None:
+                pending.append((i, CandidateProfile.from_dict(candidate_data)))
+            else:
+                results[i] = rejection
+        
+        # Step 1: one resume scan per candidate, then score all against the requirement mask
+        if skill_extractor is not None:
+            resume_skills = skill_extractor.extract_batch([c.resume_text for _, c in pending])
+        else:
+            resume_skills = [self._extract_skills(c.resume_text, c.resume_text_lc) for _, c in pending]
+        screen_scores = [self._calculate_match_score(_skills_mask(skills), job_mask) for skills in resume_skills]
+        
+        # Steps 2-3 for candidates that pass screening
+        for (i, candidate), skills, match_score in zip(pending, resume_skills, screen_scores):
+            screening = ScreeningResult(
+                match_score=match_score,
+                resume_skills=skills,
+                required_skills=list(job_skills),
+                recommendation=_recommendation(match_score)
+            )
+            self._save_to_memory("screening_result", screening)
+            if screening.recommendation == "REJECT":
+                logger.warning("Candidate %s rejected in screening", candidate.name)
+                results[i] = {"status": "REJECTED", "stage": "screening", "result": screening}
+            else:
+                results[i] = self._finish_workflow(candidate, screening, jobs_db, job_table)
+        
+        return results
+    
+    def _finish_workflow(self, candidate: CandidateProfile, screening: ScreeningResult,
+                         jobs_db: list[Dict], job_table: Optional[_JobTable] = None) -> Dict[str, Any]:
+        """Run matching and interview generation for a screened candidate and combine results."""
+        # Match jobs (Parallel: could run simultaneously in production)
+        if job_table is None:
+            matching = self.match_jobs(candidate, jobs_db)
+        else:
+            matching = self._match_encoded(candidate, jobs_db, job_table)
+        
+        # Generate interview
+        if matching.top_matches:
+            best_match = matching.top_matches[0]
+            interview = self.generate_interview(best_match.title, candidate.skills)
         else:
             interview = {"status": "NO_MATCHES"}
         
         # Combine results
-        workflow_result = {
-            "candidate_name": candidate_data["name"],
-            "overall_status": "COMPLETED",
-            "screening": screening,
-            "matching": matching,
-            "interview": interview,
-            "timestamp": datetime.now().isoformat()
-        }
+        workflow_result = _WorkflowResult(
+            candidate_name=candidate.name,
+            overall_status="COMPLETED",
+            screening=screening,
+            matching=matching,
+            interview=interview,
+            ts_ns=_ts()
+        )
         
-        logger.info(f"Workflow completed for {candidate_data['name']}")
+        logger.info("Workflow completed for %s", candidate.name)
         return workflow_result
     
-    def _extract_skills(self, resume_text: str) -> list[str]:
+    async def ascreen_candidate(self, resume_text: str, job_description: str,
+                                resume_text_lc: Optional[str] = None) -> ScreeningResult:
+        """Async variant of screen_candidate; runs off the event loop (LLM call seam)."""
+        return await asyncio.to_thread(self.screen_candidate, resume_text, job_description, resume_text_lc)
+    
+    async def amatch_jobs(self, candidate: CandidateProfile, job_database: list[Dict]) -> MatchingResult:
+        """Async variant of match_jobs."""
+        return await asyncio.to_thread(self.match_jobs, candidate, job_database)
+    
+    async def agenerate_interview(self, role_title: str, candidate_skills: list[str]) -> InterviewResult:
+        """Async variant of generate_interview."""
+        return await asyncio.to_thread(self.generate_interview, role_title, candidate_skills)
+    
+    async def afull_workflow(self, candidate_data: Dict[str, Any], job_description: str, jobs_db: list[Dict]) -> Dict[str, Any]:
+        """
+        Async variant of full_workflow.
+        
+        Stages stay sequential per candidate (each depends on the previous one),
+        but awaiting them lets other candidates' workflows progress meanwhile.
+        """
+        logger.info("Starting async workflow for: %s", candidate_data["name"])
+        
+        rejection = self._pre_screen(candidate_data, job_description)
+        if rejection is not None:
+            return rejection
+        
+        candidate = CandidateProfile.from_dict(candidate_data)
+        screening = await self.ascreen_candidate(candidate.resume_text, job_description, candidate.resume_text_lc)
+        
+        if screening.recommendation == "REJECT":
+            logger.warning("Candidate %s rejected in screening", candidate_data["name"])
+            return {"status": "REJECTED", "stage": "screening", "result": screening}
+        
+        # Post-screening steps are shared with full_workflow
+        return await asyncio.to_thread(self._finish_workflow, candidate, screening, jobs_db)
+    
+    async def afull_workflow_many(self, candidates: list[Dict[str, Any]], job_description: str, jobs_db: list[Dict]) -> list[Dict[str, Any]]:
+        """Run afull_workflow for several candidates concurrently, preserving input order."""
+        return await asyncio.gather(*[
+            self.afull_workflow(candidate_data, job_description, jobs_db) for candidate_data in candidates
+        ])
+    
+    def _pre_screen(self, candidate_data: Dict[str, Any], job_description: str) -> Optional[Dict[str, Any]]:
+        """Reject on structured fields alone; returns the rejection result or None to continue."""
+        if not candidate_data.get("skills"):
+            reason = "No skills listed"
+        elif candidate_data.get("experience_years", 0) < _min_required_years(job_description):
+            reason = "Insufficient experience"
+        else:
+            return None
+        logger.warning("Candidate %s rejected in pre-screen: %s", candidate_data["name"], reason)
+        return {"status": "REJECTED", "stage": "pre-screen", "result": {"reason": reason}}
+    
+    def _extract_skills(self, resume_text: str, text_lc: Optional[str] = None) -> list[str]:
         """Extract skills from resume (Custom Tool)."""
-        # Simulated skill extraction
-        skills = []
-        keywords = ["Python", "Java", "Machine Learning", "Data Analysis", "Cloud", "SQL", "API", "Docker"]
-        for keyword in keywords:
-            if keyword.lower() in resume_text.lower():
-                skills.append(keyword)
-        return skills
+        # Simulated skill extraction: single regex pass over the lowercased text
+        return _match_keywords(text_lc if text_lc is not None else resume_text.lower())
     
     def _extract_job_requirements(self, job_description: str) -> list[str]:
         """Extract requirements from job description (Custom Tool)."""
-        skills = []
-        keywords = ["Python", "Java", "Machine Learning", "Data Analysis", "Cloud", "SQL", "API", "Docker"]
-        for keyword in keywords:
-            if keyword.lower() in job_description.lower():
-                skills.append(keyword)
-        return skills
-    
-    def _calculate_match_score(self, candidate_skills: list[str], required_skills: list[str]) -> float:
+        return list(_job_requirements(job_description))
+    
+    def _calculate_match_score(self, candidate_mask: int, required_mask: int) -> float:
         """Calculate resume-to-job match percentage."""
-        if not required_skills:
+        if not required_mask:
             return 0
-        matches = len(set(candidate_skills) & set(required_skills))
-        return (matches / len(required_skills)) * 100
+        return ((candidate_mask & required_mask).bit_count() / required_mask.bit_count()) * 100
     
-    def _calculate_job_fit(self, candidate: CandidateProfile, job: Dict) -> float:
-        """Calculate candidate-job fit score."""
-        skill_match = len(set(candidate.skills) & set(job.get("required_skills", []))) / max(1, len(job.get("required_skills", [])))
-        exp_match = min(1.0, candidate.experience_years / max(1, job.get("years_experience_required", 1)))
-        return (skill_match * 60 + exp_match * 40)  # Weighted score
+    def _find_skill_matches(self, candidate: CandidateProfile, job: Dict, req_mask: int,
+                            req_extra: frozenset[str]) -> list[str]:
+        """Find overlapping skills: vocabulary skills first, then others as the job names them."""
+        matches = _mask_skills(candidate.skills_mask & req_mask)
+        shared_extra = candidate.skills_extra & req_extra
+        if shared_extra:
+            for skill in job.get("required_skills", ()):
+                folded = skill.casefold()
+                if folded in shared_extra:
+                    matches.append(skill)
+                    shared_extra -= {folded}
+        return matches
     
-    def _find_skill_matches(self, candidate_skills: list[str], job_skills: list[str]) -> list[str]:
-        """Find overlapping skills."""
-        return list(set(candidate_skills) & set(job_skills))
+    def set_job_database(self, jobs_db: list[Dict]) -> None:
+        """
+        Encode a job database once and pin it for following matches.
+        
+        Matches against this same list object skip fingerprinting entirely, so call
+        set_job_database again after changing the list in place. As a safety net, a
+        length change drops the pin and falls back to content fingerprinting.
+        """
+        self._pinned_jobs = (jobs_db, _encode_jobs(jobs_db))
+    
+    def _job_table_for(self, job_database: list[Dict]) -> _JobTable:
+        """
+        Return the encoded form of job_database, re-encoding only when its content changed.
+        
+        The pinned list is used as-is. Other lists are looked up by content fingerprint in
+        a small LRU, so agents alternating between several job boards keep each encoding
+        and in-place edits (appends, removals, changed skills or years) are picked up.
+        """
+        pinned_db, pinned_table = self._pinned_jobs
+        if job_database is pinned_db:
+            if len(job_database) == len(pinned_table[0]):
+                return pinned_table
+            self._pinned_jobs = (None, None)
+        
+        fingerprint = _jobs_fingerprint(job_database)
+        with self._job_tables_lock:
+            table = self._job_tables.get(fingerprint)
+            if table is not None:
+                self._job_tables.move_to_end(fingerprint)
+                return table
+        table = _encode_jobs(job_database)
+        with self._job_tables_lock:
+            self._job_tables[fingerprint] = table
+            if len(self._job_tables) > _JOB_TABLE_CACHE_SIZE:
+                self._job_tables.popitem(last=False)
+        return table
     
     def _save_to_memory(self, key: str, value: Any) -> None:
         """Store data in session memory (InMemorySessionService simulation)."""
-        self.session_state[key] = value
-        logger.debug(f"Saved to memory: {key}")
+        # Bounded history per key; results carry their own ts_ns
+        with self._memory_lock:
+            self.session_state[key].append(value)
+            if self.backing_store is not None:
+                self.backing_store[key] = value
+        logger.debug("Saved to memory: %s", key)
     
-    def get_session_state(self) -> Dict[str, Any]:
-        """Retrieve complete session state (Long-term memory)."""
-        return self.session_state
+    def get_session_state(self) -> Dict[str, list]:
+        """Retrieve a snapshot of session state, oldest entry first per key (Long-term memory)."""
+        with self._memory_lock:
+            return {key: list(history) for key, history in self.session_state.items()}
 
 def main():
     """Main entry point."""
@@ -266,12 +767,14 @@ def main():
     # Run full workflow
     result = agent.full_workflow(sample_candidate, sample_job_description, sample_jobs)
     
-    # Print results
-    print(json.dumps(result, indent=2))
+    # Print results (encoded bytes go straight to stdout)
+    out = sys.stdout.buffer
+    out.write(to_json(result) + b"\n")
     
     # Print session memory
-    print("\n=== Session Memory ===")
-    print(json.dumps(agent.get_session_state(), indent=2, default=str))
+    out.write(b"\n=== Session Memory ===\n")
+    out.write(to_json(agent.get_session_state()) + b"\n")
+    out.flush()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,38 @@
+import dataclasses
+import os
+import pickle
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import RecruitmentAgent
+
+
+class GenerateInterviewTest(unittest.TestCase):
+
+    def test_mutating_one_result_does_not_leak_into_the_next(self):
+        agent = RecruitmentAgent()
+        first = agent.generate_interview("X", ["Python"])
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            first.questions[1].question = "HACKED"
+        with self.assertRaises(TypeError):
+            first.questions[1] = None
+
+        second = agent.generate_interview("Y", ["Java"])
+        self.assertEqual(second.questions[1].question,
+                         "Walk us through a challenging project you've worked on.")
+
+    def test_dynamic_questions_use_skill_and_role(self):
+        result = RecruitmentAgent().generate_interview("Data Engineer", ["SQL"])
+        self.assertEqual([q.id for q in result.questions], [1, 2, 3, 4, 5])
+        self.assertEqual(result.questions[0].question, "Describe your experience with SQL?")
+        self.assertIn("Data Engineer", result.questions[4].question)
+
+    def test_result_is_picklable(self):
+        result = RecruitmentAgent().generate_interview("X", [])
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from main import CandidateProfile, RecruitmentAgent
+
+
+def _job(job_id, skills, years=1):
+    return {"id": job_id, "title": job_id.upper(), "company": "C",
+            "required_skills": skills, "years_experience_required": years}
+
+
+def _matches(agent, jobs):
+    candidate = CandidateProfile("A", "a@example.com", "", ["Python", "Cloud"], 5)
+    return [(m.job_id, m.match_score, m.key_matches) for m in agent.match_jobs(candidate, jobs).top_matches]
+
+
+class JobTableCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.jobs = [_job("j1", ["Python", "Cloud"]), _job("j2", ["Java"])]
+
+    def test_invalidation_after_append_pop_and_skill_edit(self):
+        agent = RecruitmentAgent()
+        self.assertEqual(_matches(agent, self.jobs), [("j1", 100.0, ["Python", "Cloud"])])
+
+        self.jobs.append(_job("j3", ["Cloud"]))
+        self.assertEqual(_matches(agent, self.jobs),
+                         [("j1", 100.0, ["Python", "Cloud"]), ("j3", 100.0, ["Cloud"])])
+
+        self.jobs.pop(0)
+        self.assertEqual(_matches(agent, self.jobs), [("j3", 100.0, ["Cloud"])])
+
+        self.jobs[0]["required_skills"] = ["Python"]
+        self.assertEqual(_matches(agent, self.jobs),
+                         [("j2", 100.0, ["Python"]), ("j3", 100.0, ["Cloud"])])
+
+    def test_pinned_list_is_refreshed_by_set_job_database(self):
+        agent = RecruitmentAgent()
+        agent.set_job_database(self.jobs)
+        self.jobs[1]["required_skills"] = ["Cloud"]
+        agent.set_job_database(self.jobs)
+        self.assertEqual(_matches(agent, self.jobs),
+                         [("j1", 100.0, ["Python", "Cloud"]), ("j2", 100.0, ["Cloud"])])
+
+    def test_pinned_list_length_change_drops_the_pin(self):
+        agent = RecruitmentAgent()
+        agent.set_job_database(self.jobs)
+        self.jobs.append(_job("j3", ["Cloud"]))
+        self.assertEqual(len(_matches(agent, self.jobs)), 2)
+        self.jobs.pop(0)
+        self.assertEqual(_matches(agent, self.jobs), [("j3", 100.0, ["Cloud"])])
+
+    def test_pinned_list_skips_fingerprinting(self):
+        agent = RecruitmentAgent()
+        agent.set_job_database(self.jobs)
+        original = main._jobs_fingerprint
+        main._jobs_fingerprint = None  # any call would fail
+        try:
+            self.assertEqual(_matches(agent, self.jobs), [("j1", 100.0, ["Python", "Cloud"])])
+        finally:
+            main._jobs_fingerprint = original
+
+    def test_alternating_job_boards_hit_the_cache(self):
+        agent = RecruitmentAgent()
+        other = [_job("k1", ["Cloud"])]
+        _matches(agent, self.jobs)
+        _matches(agent, other)
+        calls = []
+        original = main._encode_jobs
+        main._encode_jobs = lambda jobs: calls.append(jobs) or original(jobs)
+        try:
+            for _ in range(3):
+                _matches(agent, self.jobs)
+                _matches(agent, other)
+        finally:
+            main._encode_jobs = original
+        self.assertEqual(calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
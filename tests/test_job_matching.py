@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import CandidateProfile, RecruitmentAgent
+
+
+def _candidate(skills, experience_years=5):
+    return CandidateProfile(name="Candidate", email="c@example.com", resume_text="",
+                            skills=skills, experience_years=experience_years)
+
+
+def _job(job_id, required_skills, years=2):
+    return {"id": job_id, "title": f"Role {job_id}", "company": "Acme",
+            "required_skills": required_skills, "years_experience_required": years}
+
+
+class MatchJobsTest(unittest.TestCase):
+
+    def _match(self, candidate, jobs):
+        result = RecruitmentAgent().match_jobs(candidate, jobs)
+        return {m.job_id: m for m in result.top_matches}
+
+    def test_skills_compare_case_insensitively(self):
+        matches = self._match(_candidate(["python", "SQL"]), [_job("j1", ["Python", "sql"])])
+        self.assertEqual(matches["j1"].match_score, 100)
+        self.assertEqual(matches["j1"].key_matches, ["Python", "SQL"])
+
+    def test_out_of_vocabulary_skills_count_towards_the_score(self):
+        candidate = _candidate(["Python", "kubernetes", "Rust"])
+        matches = self._match(candidate, [_job("j1", ["Terraform", "Python", "Kubernetes"])])
+        # 2 of 3 required skills: 40 skill points + full experience
+        self.assertAlmostEqual(matches["j1"].match_score, 80)
+        # Vocabulary skills first, then others as the job spells them
+        self.assertEqual(matches["j1"].key_matches, ["Python", "Kubernetes"])
+
+    def test_unrelated_out_of_vocabulary_skills_do_not_match(self):
+        matches = self._match(_candidate(["Rust", "Go"]), [_job("j1", ["Terraform", "Kubernetes"])])
+        self.assertEqual(matches, {})
+
+    def test_duplicate_required_skills_count_once(self):
+        jobs = [_job("j1", ["Python", "python", "SQL"]), _job("j2", ["Go", "GO", "Python"])]
+        matches = self._match(_candidate(["Python", "go"]), jobs)
+        # j1 requires 2 distinct skills, 1 held; j2 requires 2 distinct skills, both held
+        self.assertAlmostEqual(matches["j1"].match_score, 70)
+        self.assertEqual(matches["j1"].key_matches, ["Python"])
+        self.assertEqual(matches["j2"].match_score, 100)
+        self.assertEqual(matches["j2"].key_matches, ["Python", "Go"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import RecruitmentAgent, _min_required_years
+
+JOBS = [
+    {"id": "job_001", "title": "Data Engineer", "company": "DataFlow Inc",
+     "required_skills": ["Python", "SQL"], "years_experience_required": 2},
+]
+
+
+class MinRequiredYearsTest(unittest.TestCase):
+
+    def test_requirement_phrases(self):
+        cases = {
+            "Python developer, 3+ years": 3,
+            "At least 3 years of backend work": 3,
+            "Minimum of 2 yrs with SQL": 2,
+            "Minimum 4 years": 4,
+            "3-5 years experience": 3,
+            "3 to 5 years experience": 3,
+            "1.5+ years": 1.5,
+            "5 years of Python": 0,
+            "Founded 20 years ago": 0,
+            "No stated requirement": 0,
+            "10+ years overall; 2+ years SQL": 2,
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(_min_required_years(text), expected)
+
+
+class PreScreenTest(unittest.TestCase):
+
+    JOB_DESCRIPTION = "Python developer with SQL skills, at least 3 years experience"
+
+    def _run(self, **overrides):
+        candidate = {"name": "Candidate", "email": "c@example.com", "resume": "Python and SQL engineer",
+                     "skills": ["Python", "SQL"], "experience_years": 4}
+        candidate.update(overrides)
+        return RecruitmentAgent().full_workflow(candidate, self.JOB_DESCRIPTION, JOBS)
+
+    def test_rejects_when_no_skills_listed(self):
+        result = self._run(skills=[])
+        self.assertEqual(result["status"], "REJECTED")
+        self.assertEqual(result["stage"], "pre-screen")
+        self.assertEqual(result["result"]["reason"], "No skills listed")
+
+    def test_rejects_below_minimum_experience(self):
+        result = self._run(experience_years=2)
+        self.assertEqual(result["stage"], "pre-screen")
+        self.assertEqual(result["result"]["reason"], "Insufficient experience")
+
+    def test_meeting_minimum_experience_passes(self):
+        self.assertEqual(self._run(experience_years=3)["overall_status"], "COMPLETED")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import RecruitmentAgent, SemanticSkillExtractor
+
+
+class StubExtractor(SemanticSkillExtractor):
+    """SemanticSkillExtractor with canned similarities in place of the sentence-transformers encoder."""
+
+    def __init__(self, similarities, skills=("Python", "SQL", "Docker"), threshold=0.35):
+        # Deliberately skips the base __init__, which loads the model
+        self.skills = list(skills)
+        self.threshold = threshold
+        self._table = similarities  # text -> {skill: cosine similarity}
+
+    def _similarities(self, texts):
+        return [[self._table.get(text, {}).get(skill, 0.0) for skill in self.skills] for text in texts]
+
+
+class SemanticSkillExtractorTest(unittest.TestCase):
+
+    def test_threshold_is_exclusive(self):
+        extractor = StubExtractor({"resume": {"Python": 0.36, "SQL": 0.35, "Docker": 0.34}})
+        self.assertEqual(extractor.extract_batch(["resume"]), [["Python"]])
+
+    def test_output_follows_extractor_skill_order(self):
+        extractor = StubExtractor({"resume": {"Docker": 0.9, "Python": 0.8}}, skills=("Docker", "SQL", "Python"))
+        self.assertEqual(extractor.extract_batch(["resume", "unknown"]), [["Docker", "Python"], []])
+
+    def test_empty_batch_skips_the_encoder(self):
+        self.assertEqual(StubExtractor({}).extract_batch([]), [])
+
+    def test_full_workflow_batch_screens_with_the_extractor(self):
+        jobs = [{"id": "job_001", "title": "Data Engineer", "company": "DataFlow Inc",
+                 "required_skills": ["Python", "SQL"], "years_experience_required": 2}]
+        candidates = [
+            # No keywords in the resume, but semantically close to both required skills
+            {"name": "Semantic Match", "email": "a@example.com", "resume": "Builds pandas pipelines over Postgres",
+             "skills": ["Python", "SQL"], "experience_years": 3},
+            # Keywords present, but the extractor finds nothing
+            {"name": "Keyword Only", "email": "b@example.com", "resume": "Python SQL",
+             "skills": ["Python", "SQL"], "experience_years": 3},
+        ]
+        extractor = StubExtractor({"Builds pandas pipelines over Postgres": {"Python": 0.6, "SQL": 0.7}})
+        results = RecruitmentAgent().full_workflow_batch(
+            candidates, "Python developer with SQL skills", jobs, skill_extractor=extractor)
+        self.assertEqual(results[0]["overall_status"], "COMPLETED")
+        self.assertEqual(results[0]["screening"].resume_skills, ["Python", "SQL"])
+        self.assertEqual(results[0]["screening"].match_score, 100)
+        self.assertEqual(results[1]["stage"], "screening")
+        self.assertEqual(results[1]["result"].resume_skills, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
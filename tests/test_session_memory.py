@@ -0,0 +1,59 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import RecruitmentAgent
+
+JOB_DESCRIPTION = "Python developer with SQL skills, 2+ years experience"
+
+JOBS = [
+    {"id": "job_001", "title": "Data Engineer", "company": "DataFlow Inc",
+     "required_skills": ["Python", "SQL"], "years_experience_required": 2},
+]
+
+
+class SingleWriterStore(dict):
+    """Backing store that records whether two threads ever wrote at once, like a shelve would corrupt."""
+
+    def __init__(self):
+        super().__init__()
+        self._active = 0
+        self._guard = threading.Lock()
+        self.overlapped = False
+
+    def __setitem__(self, key, value):
+        with self._guard:
+            self._active += 1
+            self.overlapped |= self._active > 1
+        time.sleep(0.001)
+        super().__setitem__(key, value)
+        with self._guard:
+            self._active -= 1
+
+
+class SessionMemoryTest(unittest.TestCase):
+
+    def test_concurrent_workflows_serialize_memory_writes(self):
+        store = SingleWriterStore()
+        agent = RecruitmentAgent(backing_store=store)
+        candidates = [
+            {"name": f"Candidate {n}", "email": f"c{n}@example.com", "resume": "Python and SQL engineer",
+             "skills": ["Python", "SQL"], "experience_years": 3}
+            for n in range(8)
+        ]
+        results = asyncio.run(agent.afull_workflow_many(candidates, JOB_DESCRIPTION, JOBS))
+        self.assertTrue(all(r["overall_status"] == "COMPLETED" for r in results))
+        self.assertFalse(store.overlapped)
+        history = agent.get_session_state()
+        self.assertEqual(len(history["screening_result"]), 8)
+        self.assertEqual(len(history["matching_result"]), 8)
+        self.assertEqual(set(store), {"screening_result", "matching_result", "interview_questions"})
+
+
+if __name__ == "__main__":
+    unittest.main()
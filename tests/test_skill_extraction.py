@@ -0,0 +1,51 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import KEYWORDS, RecruitmentAgent
+
+
+def _substring_skills(text):
+    """The original per-keyword extraction the compiled pattern must agree with."""
+    return [k for k in KEYWORDS if k.lower() in text.lower()]
+
+
+class SkillExtractionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = RecruitmentAgent()
+
+    def test_inflected_and_compound_forms_match(self):
+        text = "Built REST APIs with Dockerized services on PostgreSQL"
+        self.assertEqual(self.agent._extract_skills(text), ["SQL", "API", "Docker"])
+        self.assertEqual(self.agent._extract_skills("MySQL and Pythonic APIs"), ["Python", "SQL", "API"])
+
+    def test_keywords_inside_longer_words_match(self):
+        self.assertEqual(self.agent._extract_skills("JavaScript on CloudFront"), ["Java", "Cloud"])
+
+    def test_overlapping_keywords_are_all_found(self):
+        self.assertEqual(self.agent._extract_skills("javapi"), ["Java", "API"])
+
+    def test_results_follow_vocabulary_order_case_insensitively(self):
+        text = "DOCKER, sql, Machine learning and data ANALYSIS in python"
+        self.assertEqual(self.agent._extract_skills(text),
+                         ["Python", "Machine Learning", "Data Analysis", "SQL", "Docker"])
+
+    def test_agrees_with_substring_extraction(self):
+        texts = [
+            "",
+            "No relevant experience",
+            "Senior ML engineer: Python, TensorFlow, machine-learning, AWS Cloud, SQL",
+            "Java/Kotlin backend, gRPC APIs, Docker Compose, data analysis with pandas",
+            "machine learning machine learning pythonpython",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(self.agent._extract_skills(text), _substring_skills(text))
+                self.assertEqual(self.agent._extract_job_requirements(text), _substring_skills(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
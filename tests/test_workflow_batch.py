@@ -0,0 +1,69 @@
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from main import RecruitmentAgent, to_json
+
+JOB_DESCRIPTION = "Python developer with SQL skills, 2+ years experience"
+
+JOBS = [
+    {"id": "job_001", "title": "Data Engineer", "company": "DataFlow Inc",
+     "required_skills": ["Python", "SQL"], "years_experience_required": 2},
+    {"id": "job_002", "title": "Backend Developer", "company": "WebServices Ltd",
+     "required_skills": ["Java", "Docker"], "years_experience_required": 5},
+]
+
+CANDIDATES = [
+    # Completes the workflow
+    {"name": "Completed", "email": "c@example.com", "resume": "Python and SQL engineer",
+     "skills": ["Python", "SQL"], "experience_years": 3},
+    # Rejected in screening: no required skills in the resume
+    {"name": "Screened Out", "email": "s@example.com", "resume": "Java and Docker developer",
+     "skills": ["Java"], "experience_years": 6},
+    # Rejected in pre-screen: below the stated minimum experience
+    {"name": "Too Junior", "email": "j@example.com", "resume": "Python and SQL intern",
+     "skills": ["Python"], "experience_years": 1},
+    # Rejected in pre-screen: no skills listed
+    {"name": "No Skills", "email": "n@example.com", "resume": "Python and SQL",
+     "skills": [], "experience_years": 4},
+]
+
+
+def _plain(results):
+    """Serialize results the way main() does and drop the per-call timestamps."""
+    def strip(obj):
+        if isinstance(obj, dict):
+            return {k: strip(v) for k, v in obj.items() if k != "timestamp"}
+        if isinstance(obj, list):
+            return [strip(v) for v in obj]
+        return obj
+    return strip(json.loads(to_json(results)))
+
+
+class FullWorkflowBatchTest(unittest.TestCase):
+
+    def test_batch_matches_per_candidate_workflow(self):
+        agent = RecruitmentAgent()
+        single = _plain([agent.full_workflow(c, JOB_DESCRIPTION, JOBS) for c in CANDIDATES])
+        batch = _plain(RecruitmentAgent().full_workflow_batch(CANDIDATES, JOB_DESCRIPTION, JOBS))
+        self.assertEqual(batch, single)
+
+    def test_batch_covers_every_outcome(self):
+        results = RecruitmentAgent().full_workflow_batch(CANDIDATES, JOB_DESCRIPTION, JOBS)
+        outcomes = [r.get("overall_status") or r["stage"] for r in results]
+        self.assertEqual(outcomes, ["COMPLETED", "screening", "pre-screen", "pre-screen"])
+
+    def test_batch_fingerprints_jobs_once(self):
+        candidates = [dict(CANDIDATES[0], name=f"Completed {n}") for n in range(3)]
+        with mock.patch.object(main, "_jobs_fingerprint", wraps=main._jobs_fingerprint) as fingerprint:
+            RecruitmentAgent().full_workflow_batch(candidates, JOB_DESCRIPTION, JOBS)
+        self.assertEqual(fingerprint.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()